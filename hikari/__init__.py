@@ -28,7 +28,8 @@ for writing a bot, or `RESTApp` if you only need to use the REST API.
 
 from __future__ import annotations
 
-import os as _os
+import importlib as _importlib
+import typing as _typing
 
 from hikari._about import __author__
 from hikari._about import __ci__
@@ -71,9 +72,6 @@ from hikari.files import Pathish
 from hikari.files import Rawish
 from hikari.files import Resourceish
 from hikari.guilds import *
-from hikari.impl.bot import BotApp
-from hikari.impl.rest import ClientCredentialsStrategy
-from hikari.impl.rest import RESTApp
 from hikari.intents import *
 from hikari.invites import *
 from hikari.iterators import *
@@ -98,8 +96,39 @@ from hikari.users import *
 from hikari.voices import *
 from hikari.webhooks import *
 
-# Only expose this during documentation, as we need it to make anything visible.
-if _os.getenv("PDOC3_GENERATING") == "1":  # pragma: no cover
-    __all__ = [name for name in dir() if not name.startswith("_")]
+if _typing.TYPE_CHECKING:
+    from hikari.impl.bot import BotApp
+    from hikari.impl.rest import ClientCredentialsStrategy
+    from hikari.impl.rest import RESTApp
 
-del _os
+else:
+    # The implementations pull in the gateway, REST client, cache and entity factory,
+    # which dominates the cost of `import hikari`, so they are only imported once
+    # one of these names is first accessed.
+    #
+    # This is hidden from type checkers so that they only see the names imported
+    # above, rather than accepting any attribute on this module.
+    _LAZY_ATTRIBUTES: _typing.Final[_typing.Mapping[str, str]] = {
+        "BotApp": "hikari.impl.bot",
+        "ClientCredentialsStrategy": "hikari.impl.rest",
+        "RESTApp": "hikari.impl.rest",
+    }
+
+    def __getattr__(name: str) -> _typing.Any:
+        try:
+            module_name = _LAZY_ATTRIBUTES[name]
+        except KeyError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+        value = getattr(_importlib.import_module(module_name), name)
+        globals()[name] = value
+        return value
+
+    def __dir__() -> _typing.List[str]:
+        return sorted({*globals(), *_LAZY_ATTRIBUTES})
+
+    # Without this, `from hikari import *` would only copy the names already in the
+    # module dict and skip the lazy ones. Listing them here makes the import machinery
+    # resolve them through `__getattr__` instead. This is also what makes anything
+    # visible to the documentation.
+    __all__ = [name for name in __dir__() if not name.startswith("_")]
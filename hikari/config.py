@@ -278,13 +278,15 @@ class HTTPSettings:
         it.
     """
 
-    force_close_transports: bool = attr.field(default=True, validator=attr.validators.instance_of(bool))
-    """Toggle whether to force close transports on shutdown.
-
-    This defaults to `builtins.True` to combat various protocol and asyncio
-    issues present when using Microsoft Windows. If you are sure you know
-    what you are doing, you may instead set this to `False` to disable this
-    behavior internally.
+    force_close_transports: bool = attr.field(default=False, validator=attr.validators.instance_of(bool))
+    """Toggle whether to close each connection once a request has completed.
+
+    This defaults to `builtins.False`, which keeps connections alive in the
+    connection pool so that subsequent requests to Discord can reuse them
+    rather than performing a new TCP and TLS handshake each time. If you
+    experience protocol issues with reused connections (which have been seen
+    on some Microsoft Windows setups), you may set this to `builtins.True`
+    to disable connection reuse.
 
     Returns
     -------
@@ -54,13 +54,24 @@ from hikari import users as user_models
 from hikari import voices as voice_models
 from hikari import webhooks as webhook_models
 from hikari.api import entity_factory
-from hikari.internal import attr_extensions
 from hikari.internal import data_binding
 from hikari.internal import time
 
 _DEFAULT_MAX_PRESENCES: typing.Final[int] = 25000
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.entity_factory")
 _ValueT = typing.TypeVar("_ValueT")
+# Shared by deserialized models in place of allocating a new empty list for
+# every absent or empty array field.
+_EMPTY_SEQUENCE: typing.Final[typing.Sequence[typing.Any]] = ()
+# These are resolved on every message, so we go straight to the member maps
+# rather than through the enum metaclass __call__. The maps are not visible to
+# type checkers, hence the getattr.
+_MESSAGE_TYPES: typing.Final[typing.Mapping[int, message_models.MessageType]] = getattr(
+    message_models.MessageType, "_value_to_member_map_"
+)
+_MESSAGE_ACTIVITY_TYPES: typing.Final[typing.Mapping[int, message_models.MessageActivityType]] = getattr(
+    message_models.MessageActivityType, "_value_to_member_map_"
+)
 
 
 def _with_int_cast(cast: typing.Callable[[int], _ValueT]) -> typing.Callable[[typing.Any], _ValueT]:
@@ -84,8 +95,7 @@ def _deserialize_max_age(seconds: int) -> typing.Optional[datetime.timedelta]:
     return datetime.timedelta(seconds=seconds) if seconds > 0 else None
 
 
-@attr_extensions.with_copy
-@attr.define(kw_only=True, repr=False, weakref_slot=False)
+@attr.define(kw_only=True, repr=False, eq=False, weakref_slot=False)
 class _GuildChannelFields:
     id: snowflakes.Snowflake = attr.field()
     name: typing.Optional[str] = attr.field()
@@ -97,17 +107,7 @@ class _GuildChannelFields:
     parent_id: typing.Optional[snowflakes.Snowflake] = attr.field()
 
 
-@attr_extensions.with_copy
-@attr.define(kw_only=True, repr=False, weakref_slot=False)
-class _IntegrationFields:
-    id: snowflakes.Snowflake = attr.field()
-    name: str = attr.field()
-    type: typing.Union[guild_models.IntegrationType, str] = attr.field()
-    account: guild_models.IntegrationAccount = attr.field()
-
-
-@attr_extensions.with_copy
-@attr.define(kw_only=True, repr=False, weakref_slot=False)
+@attr.define(kw_only=True, repr=False, eq=False, weakref_slot=False)
 class _GuildFields:
     id: snowflakes.Snowflake = attr.field()
     name: str = attr.field()
@@ -139,8 +139,7 @@ class _GuildFields:
     is_nsfw: bool = attr.field()
 
 
-@attr_extensions.with_copy
-@attr.define(kw_only=True, repr=False, weakref_slot=False)
+@attr.define(kw_only=True, repr=False, eq=False, weakref_slot=False)
 class _InviteFields:
     code: str = attr.field()
     guild: typing.Optional[invite_models.InviteGuild] = attr.field()
@@ -154,8 +153,7 @@ class _InviteFields:
     approximate_member_count: typing.Optional[int] = attr.field()
 
 
-@attr_extensions.with_copy
-@attr.define(kw_only=True, repr=False, weakref_slot=False)
+@attr.define(kw_only=True, repr=False, eq=False, weakref_slot=False)
 class _UserFields:
     id: snowflakes.Snowflake = attr.field()
     discriminator: str = attr.field()
@@ -1013,7 +1011,7 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
     def deserialize_known_custom_emoji(
         self, payload: data_binding.JSONObject, *, guild_id: snowflakes.Snowflake
     ) -> emoji_models.KnownCustomEmoji:
-        role_ids = [snowflakes.Snowflake(role_id) for role_id in payload["roles"]] if "roles" in payload else []
+        role_ids = list(map(snowflakes.Snowflake, payload["roles"])) if "roles" in payload else []
 
         user: typing.Optional[user_models.User] = None
         if (raw_user := payload.get("user")) is not None:
@@ -1126,7 +1124,7 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         if guild_id is undefined.UNDEFINED:
             guild_id = snowflakes.Snowflake(payload["guild_id"])
 
-        role_ids = [snowflakes.Snowflake(role_id) for role_id in payload["roles"]]
+        role_ids = list(map(snowflakes.Snowflake, payload["roles"]))
         # If Discord ever does start including this here without warning we don't want to duplicate the entry.
         if guild_id not in role_ids:
             role_ids.append(guild_id)
@@ -1184,24 +1182,13 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
             is_premium_subscriber_role=is_premium_subscriber_role,
         )
 
-    @staticmethod
-    def _set_partial_integration_attributes(payload: data_binding.JSONObject) -> _IntegrationFields:
+    def deserialize_partial_integration(self, payload: data_binding.JSONObject) -> guild_models.PartialIntegration:
         account_payload = payload["account"]
-        account = guild_models.IntegrationAccount(id=account_payload["id"], name=account_payload["name"])
-        return _IntegrationFields(
+        return guild_models.PartialIntegration(
             id=snowflakes.Snowflake(payload["id"]),
             name=payload["name"],
             type=guild_models.IntegrationType(payload["type"]),
-            account=account,
-        )
-
-    def deserialize_partial_integration(self, payload: data_binding.JSONObject) -> guild_models.PartialIntegration:
-        integration_fields = self._set_partial_integration_attributes(payload)
-        return guild_models.PartialIntegration(
-            id=integration_fields.id,
-            name=integration_fields.name,
-            type=integration_fields.type,
-            account=integration_fields.account,
+            account=guild_models.IntegrationAccount(id=account_payload["id"], name=account_payload["name"]),
         )
 
     def deserialize_integration(
@@ -1210,8 +1197,6 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         *,
         guild_id: undefined.UndefinedOr[snowflakes.Snowflake] = undefined.UNDEFINED,
     ) -> guild_models.Integration:
-        integration_fields = self._set_partial_integration_attributes(payload)
-
         role_id: typing.Optional[snowflakes.Snowflake] = None
         if (raw_role_id := payload.get("role_id")) is not None:
             role_id = snowflakes.Snowflake(raw_role_id)
@@ -1247,12 +1232,13 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
                 bot=bot,
             )
 
+        account_payload = payload["account"]
         return guild_models.Integration(
-            id=integration_fields.id,
+            id=snowflakes.Snowflake(payload["id"]),
             guild_id=guild_id if guild_id is not undefined.UNDEFINED else snowflakes.Snowflake(payload["guild_id"]),
-            name=integration_fields.name,
-            type=integration_fields.type,
-            account=integration_fields.account,
+            name=payload["name"],
+            type=guild_models.IntegrationType(payload["type"]),
+            account=guild_models.IntegrationAccount(id=account_payload["id"], name=account_payload["name"]),
             is_enabled=payload["enabled"],
             is_syncing=payload.get("syncing"),
             is_revoked=payload.get("revoked"),
@@ -1616,8 +1602,9 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
     ##################
 
     def _deserialize_message_activity(self, payload: data_binding.JSONObject) -> message_models.MessageActivity:
+        raw_type = payload["type"]
         return message_models.MessageActivity(
-            type=message_models.MessageActivityType(payload["type"]), party_id=payload.get("party_id")
+            type=_MESSAGE_ACTIVITY_TYPES.get(raw_type, raw_type), party_id=payload.get("party_id")
         )
 
     def _deserialize_message_application(self, payload: data_binding.JSONObject) -> message_models.MessageApplication:
@@ -1740,6 +1727,10 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         if "stickers" in payload:
             stickers = [self._deserialize_sticker(sticker) for sticker in payload["stickers"]]
 
+        type_: undefined.UndefinedOr[typing.Union[message_models.MessageType, int]] = undefined.UNDEFINED
+        if (raw_type := payload.get("type")) is not None:
+            type_ = _MESSAGE_TYPES.get(raw_type, raw_type)
+
         message = message_models.PartialMessage(
             app=self._app,
             id=snowflakes.Snowflake(payload["id"]),
@@ -1756,7 +1747,7 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
             reactions=reactions,
             is_pinned=payload["pinned"] if "pinned" in payload else undefined.UNDEFINED,
             webhook_id=snowflakes.Snowflake(payload["webhook_id"]) if "webhook_id" in payload else undefined.UNDEFINED,
-            type=message_models.MessageType(payload["type"]) if "type" in payload else undefined.UNDEFINED,
+            type=type_,
             activity=activity,
             application=application,
             message_reference=message_reference,
@@ -1780,7 +1771,7 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
 
         role_ids: undefined.UndefinedOr[typing.Sequence[snowflakes.Snowflake]] = undefined.UNDEFINED
         if raw_role_ids := payload.get("mention_roles"):
-            role_ids = [snowflakes.Snowflake(i) for i in raw_role_ids]
+            role_ids = list(map(snowflakes.Snowflake, raw_role_ids))
 
         everyone = payload.get("mention_everyone", undefined.UNDEFINED)
 
@@ -1797,35 +1788,40 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
     def deserialize_message(  # noqa CFQ001 - Function too long
         self, payload: data_binding.JSONObject
     ) -> message_models.Message:
-        guild_id = snowflakes.Snowflake(payload["guild_id"]) if "guild_id" in payload else None
+        guild_id: typing.Optional[snowflakes.Snowflake] = None
+        if (raw_guild_id := payload.get("guild_id")) is not None:
+            guild_id = snowflakes.Snowflake(raw_guild_id)
+
         author = self.deserialize_user(payload["author"])
 
         member: typing.Optional[guild_models.Member] = None
-        if "member" in payload:
+        if (member_payload := payload.get("member")) is not None:
             assert guild_id is not None
-            member = self.deserialize_member(payload["member"], guild_id=guild_id, user=author)
+            member = self.deserialize_member(member_payload, guild_id=guild_id, user=author)
 
         edited_timestamp: typing.Optional[datetime.datetime] = None
         if (raw_edited_timestamp := payload["edited_timestamp"]) is not None:
             edited_timestamp = time.iso8601_datetime_string_to_datetime(raw_edited_timestamp)
 
-        attachments = [self._deserialize_message_attachment(attachment) for attachment in payload["attachments"]]
-
-        embeds = [self.deserialize_embed(embed) for embed in payload["embeds"]]
+        attachments: typing.Sequence[message_models.Attachment] = _EMPTY_SEQUENCE
+        if attachment_payloads := payload["attachments"]:
+            attachments = list(map(self._deserialize_message_attachment, attachment_payloads))
 
-        if "reactions" in payload:
-            reactions = [self._deserialize_message_reaction(reaction) for reaction in payload["reactions"]]
+        embeds: typing.Sequence[embed_models.Embed] = _EMPTY_SEQUENCE
+        if embed_payloads := payload["embeds"]:
+            embeds = list(map(self.deserialize_embed, embed_payloads))
 
-        else:
-            reactions = []
+        reactions: typing.Sequence[message_models.Reaction] = _EMPTY_SEQUENCE
+        if reaction_payloads := payload.get("reactions"):
+            reactions = list(map(self._deserialize_message_reaction, reaction_payloads))
 
         activity: typing.Optional[message_models.MessageActivity] = None
-        if "activity" in payload:
-            activity = self._deserialize_message_activity(payload["activity"])
+        if (activity_payload := payload.get("activity")) is not None:
+            activity = self._deserialize_message_activity(activity_payload)
 
         message_reference: typing.Optional[message_models.MessageReference] = None
-        if "message_reference" in payload:
-            message_reference = self._deserialize_message_reference(payload["message_reference"])
+        if (message_reference_payload := payload.get("message_reference")) is not None:
+            message_reference = self._deserialize_message_reference(message_reference_payload)
 
         referenced_message: undefined.UndefinedNoneOr[message_models.Message] = undefined.UNDEFINED
         if "referenced_message" in payload:
@@ -1835,14 +1831,22 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
                 referenced_message = None
 
         application: typing.Optional[message_models.MessageApplication] = None
-        if "application" in payload:
-            application = self._deserialize_message_application(payload["application"])
+        if (application_payload := payload.get("application")) is not None:
+            application = self._deserialize_message_application(application_payload)
 
-        if "stickers" in payload:
-            stickers = [self._deserialize_sticker(sticker) for sticker in payload["stickers"]]
+        stickers: typing.Sequence[message_models.Sticker] = _EMPTY_SEQUENCE
+        if sticker_payloads := payload.get("stickers"):
+            stickers = list(map(self._deserialize_sticker, sticker_payloads))
 
-        else:
-            stickers = []
+        webhook_id: typing.Optional[snowflakes.Snowflake] = None
+        if (raw_webhook_id := payload.get("webhook_id")) is not None:
+            webhook_id = snowflakes.Snowflake(raw_webhook_id)
+
+        flags: typing.Optional[message_models.MessageFlag] = None
+        if (raw_flags := payload.get("flags")) is not None:
+            flags = message_models.MessageFlag(raw_flags)
+
+        raw_type = payload["type"]
 
         message = message_models.Message(
             app=self._app,
@@ -1859,13 +1863,13 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
             embeds=embeds,
             reactions=reactions,
             is_pinned=payload["pinned"],
-            webhook_id=snowflakes.Snowflake(payload["webhook_id"]) if "webhook_id" in payload else None,
-            type=message_models.MessageType(payload["type"]),
+            webhook_id=webhook_id,
+            type=_MESSAGE_TYPES.get(raw_type, raw_type),
             activity=activity,
             application=application,
             message_reference=message_reference,
             referenced_message=referenced_message,
-            flags=message_models.MessageFlag(payload["flags"]) if "flags" in payload else None,
+            flags=flags,
             stickers=stickers,
             nonce=payload.get("nonce"),
             # We initialize these next.
@@ -1880,9 +1884,9 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         if raw_users := payload.get("mentions"):
             users = {u.id: u for u in map(self.deserialize_user, raw_users)}
 
-        role_ids: typing.Sequence[snowflakes.Snowflake] = []
+        role_ids: typing.Sequence[snowflakes.Snowflake] = _EMPTY_SEQUENCE
         if raw_role_ids := payload.get("mention_roles"):
-            role_ids = [snowflakes.Snowflake(i) for i in raw_role_ids]
+            role_ids = list(map(snowflakes.Snowflake, raw_role_ids))
 
         everyone = payload.get("mention_everyone", False)
 
@@ -2096,18 +2100,19 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         )
 
     def deserialize_user(self, payload: data_binding.JSONObject) -> user_models.User:
-        user_fields = self._set_user_attributes(payload)
+        # This is called for every message author and member, so the fields are
+        # read straight from the payload rather than through _set_user_attributes.
         flags = (
             user_models.UserFlag(payload["public_flags"]) if "public_flags" in payload else user_models.UserFlag.NONE
         )
         return user_models.UserImpl(
             app=self._app,
-            id=user_fields.id,
-            discriminator=user_fields.discriminator,
-            username=user_fields.username,
-            avatar_hash=user_fields.avatar_hash,
-            is_bot=user_fields.is_bot,
-            is_system=user_fields.is_system,
+            id=snowflakes.Snowflake(payload["id"]),
+            discriminator=payload["discriminator"],
+            username=payload["username"],
+            avatar_hash=payload["avatar"],
+            is_bot=payload.get("bot", False),
+            is_system=payload.get("system", False),
             flags=flags,
         )
 
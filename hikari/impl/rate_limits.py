@@ -305,20 +305,20 @@ class WindowedBurstRateLimiter(BurstRateLimiter):
         Calling this function will cause it to block until you are not longer
         being rate limited.
         """
+        # If we are not rate limited and nothing is queued, take a token straight away
+        # without allocating a future to wait on.
+        if self.throttle_task is None and not self.is_rate_limited(time.monotonic()):
+            self.drip()
+            return
+
+        # Otherwise, delegate invoking this to the throttler and spin it up if it hasn't
+        # started. If the throttle task is still running, we should delegate releasing the
+        # future to the throttler task so that we still process first-come-first-serve
         loop = asyncio.get_running_loop()
         future = loop.create_future()
-
-        # If we are rate limited, delegate invoking this to the throttler and spin it up
-        # if it hasn't started. Likewise, if the throttle task is still running, we should
-        # delegate releasing the future to the throttler task so that we still process
-        # first-come-first-serve
-        if self.throttle_task is not None or self.is_rate_limited(time.monotonic()):
-            self.queue.append(future)
-            if self.throttle_task is None:
-                self.throttle_task = loop.create_task(self.throttle())
-        else:
-            self.drip()
-            future.set_result(None)
+        self.queue.append(future)
+        if self.throttle_task is None:
+            self.throttle_task = loop.create_task(self.throttle())
 
         try:
             await future
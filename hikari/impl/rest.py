@@ -828,7 +828,8 @@ class RESTClientImpl(rest_api.RESTClient):
                 f"received rate limited response with unexpected response type {response.content_type}",
             )
 
-        body = await response.json()
+        body = data_binding.load_json(await response.read())
+        assert isinstance(body, dict)
         body_retry_after = float(body["retry_after"])
 
         if body.get("global", False) is True:
@@ -81,20 +81,44 @@ _StringMapBuilderArg = typing.Union[
 if typing.TYPE_CHECKING:
 
     def dump_json(_: typing.Union[JSONArray, JSONObject]) -> str:
-        """Convert a Python type to a JSON string."""
+        """Convert a Python type to a JSON string.
+
+        All object keys must be `builtins.str`.
+        """
 
     def load_json(_: typing.AnyStr) -> typing.Union[JSONArray, JSONObject]:
         """Convert a JSON string to a Python type."""
 
 
 else:
-    import json
+    try:  # pragma: no cover
+        # orjson parses and serializes several times faster than the standard
+        # library, which matters for gateway events where every payload that
+        # arrives gets decoded.
+        import orjson
+
+        def dump_json(obj: typing.Union[JSONArray, JSONObject]) -> str:
+            """Convert a Python type to a JSON string.
+
+            All object keys must be `builtins.str`, as orjson raises a
+            `builtins.TypeError` for any other key type.
+            """
+            return orjson.dumps(obj).decode("utf-8")
+
+        load_json = orjson.loads
+        """Convert a JSON string to a Python type."""
+
+    except ImportError:  # pragma: no cover
+        import json
 
-    dump_json = json.dumps
-    """Convert a Python type to a JSON string."""
+        dump_json = json.dumps
+        """Convert a Python type to a JSON string.
 
-    load_json = json.loads
-    """Convert a JSON string to a Python type."""
+        All object keys must be `builtins.str`.
+        """
+
+        load_json = json.loads
+        """Convert a JSON string to a Python type."""
 
 
 @typing.final
@@ -32,6 +32,7 @@ import typing
 import aiohttp
 
 from hikari import errors
+from hikari.internal import data_binding
 
 if typing.TYPE_CHECKING:
     from hikari import config
@@ -165,4 +166,5 @@ def create_client_session(
         trust_env=trust_env,
         version=aiohttp.HttpVersion11,
         ws_response_class=ws_response_cls,
+        json_serialize=data_binding.dump_json,
     )
@@ -3232,17 +3232,17 @@ class TestEntityFactoryImpl:
         assert message.edited_timestamp is None
         assert message.mentions.everyone is True
         assert message.mentions.user_ids == []
-        assert message.mentions.role_ids == []
+        assert message.mentions.role_ids == ()
         assert message.mentions.channels_ids == []
-        assert message.attachments == []
-        assert message.embeds == []
-        assert message.reactions == []
+        assert message.attachments == ()
+        assert message.embeds == ()
+        assert message.reactions == ()
         assert message.webhook_id is None
         assert message.activity is None
         assert message.application is None
         assert message.message_reference is None
         assert message.referenced_message is undefined.UNDEFINED
-        assert message.stickers == []
+        assert message.stickers == ()
         assert message.nonce is None
 
     def test_deserialize_message_with_other_unset_fields(self, entity_factory_impl, message_payload):
@@ -219,7 +219,7 @@ class TestWindowedBurstRateLimiter:
         await ratelimiter.acquire()
 
         ratelimiter.drip.assert_called_once_with()
-        future.set_result.assert_called_once_with(None)
+        event_loop.create_future.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_no_drip_if_throttle_task_is_not_None(self, ratelimiter, event_loop):
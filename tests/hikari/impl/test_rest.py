@@ -650,6 +650,7 @@ class TestRESTClientImpl:
                 trust_env=False,
                 version=aiohttp.HttpVersion11,
                 ws_response_class=aiohttp.ClientWebSocketResponse,
+                json_serialize=data_binding.dump_json,
             )
 
     def test__acquire_client_session_when_not_None_and_open(self, rest_client):
@@ -1284,7 +1285,7 @@ class TestRESTClientImplAsync:
             content_type = rest._APPLICATION_JSON
             headers = {}
 
-            async def json(self):
+            async def read(self):
                 raise exit_exception
 
         route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
@@ -1312,8 +1313,8 @@ class TestRESTClientImplAsync:
             headers = {}
             real_url = "https://some.url"
 
-            async def json(self):
-                return {"global": True, "retry_after": "2"}
+            async def read(self):
+                return b'{"global": true, "retry_after": "2"}'
 
         route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
         with pytest.raises(rest_client._RetryRequest):
@@ -1330,8 +1331,8 @@ class TestRESTClientImplAsync:
             }
             real_url = "https://some.url"
 
-            async def json(self):
-                return {"retry_after": "2", "global": False}
+            async def read(self):
+                return b'{"retry_after": "2", "global": false}'
 
         route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
         with pytest.raises(rest_client._RetryRequest):
@@ -1346,8 +1347,8 @@ class TestRESTClientImplAsync:
             }
             real_url = "https://some.url"
 
-            async def json(self):
-                return {"retry_after": "0.002"}
+            async def read(self):
+                return b'{"retry_after": "0.002"}'
 
         route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
         with pytest.raises(rest_client._RetryRequest):
@@ -1360,8 +1361,8 @@ class TestRESTClientImplAsync:
             headers = {}
             real_url = "https://some.url"
 
-            async def json(self):
-                return {"retry_after": "4"}
+            async def read(self):
+                return b'{"retry_after": "4"}'
 
         route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
         with pytest.raises(errors.RateLimitedError):
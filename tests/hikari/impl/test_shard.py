@@ -36,6 +36,7 @@ from hikari import presences
 from hikari import undefined
 from hikari.impl import shard
 from hikari.internal import aio
+from hikari.internal import data_binding
 from hikari.internal import time
 from tests.hikari import client_session_stub
 from tests.hikari import hikari_test_helpers
@@ -105,6 +106,17 @@ class TestGatewayTransport:
         transport_impl._receive_and_check.assert_awaited_once_with(69)
         mock_loads.assert_called_once_with("{'json_response': null}")
 
+    @pytest.mark.parametrize("trace", [True, False])
+    async def test_receive_json_when_bytes(self, transport_impl, trace):
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b"{'json_response': null}")
+        transport_impl.logger.isEnabledFor.return_value = trace
+        mock_loads = mock.Mock(return_value={"json_response": None})
+
+        assert await transport_impl.receive_json(loads=mock_loads, timeout=69) == {"json_response": None}
+
+        transport_impl._receive_and_check.assert_awaited_once_with(69)
+        mock_loads.assert_called_once_with(b"{'json_response': null}")
+
     @pytest.mark.parametrize("trace", [True, False])
     async def test_send_json(self, transport_impl, trace):
         transport_impl.send_str = mock.AsyncMock()
@@ -192,17 +204,30 @@ class TestGatewayTransport:
         response2 = self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"data")
         response3 = self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"\x00\x00\xff\xff")
         transport_impl.receive = mock.AsyncMock(side_effect=[response1, response2, response3])
-        transport_impl.zlib = mock.Mock(decompress=mock.Mock(return_value=b"utf-8 encoded bytes"))
+        transport_impl.zlib = mock.Mock(decompress=mock.Mock(side_effect=[b"utf-8 ", b"encoded ", b"bytes"]))
 
-        assert await transport_impl._receive_and_check(10) == "utf-8 encoded bytes"
+        assert await transport_impl._receive_and_check(10) == b"utf-8 encoded bytes"
 
         transport_impl.receive.assert_awaited_with(10)
-        transport_impl.zlib.decompress.assert_called_once_with(bytearray(b"somedata\x00\x00\xff\xff"))
+        transport_impl.zlib.decompress.assert_has_calls(
+            [mock.call(b"some"), mock.call(b"data"), mock.call(b"\x00\x00\xff\xff")]
+        )
+
+    async def test__receive_and_check_when_message_type_is_BINARY_and_single_frame(self, transport_impl):
+        response = self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"somedata\x00\x00\xff\xff")
+        transport_impl.receive = mock.AsyncMock(return_value=response)
+        transport_impl.zlib = mock.Mock(decompress=mock.Mock(return_value=b"utf-8 encoded bytes"))
+
+        assert await transport_impl._receive_and_check(10) == b"utf-8 encoded bytes"
+
+        transport_impl.receive.assert_awaited_once_with(10)
+        transport_impl.zlib.decompress.assert_called_once_with(b"somedata\x00\x00\xff\xff")
 
     async def test__receive_and_check_when_buff_but_next_is_not_BINARY(self, transport_impl):
         response1 = self.StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"some")
         response2 = self.StubResponse(type=aiohttp.WSMsgType.TEXT)
         transport_impl.receive = mock.AsyncMock(side_effect=[response1, response2])
+        transport_impl.zlib = mock.Mock(decompress=mock.Mock(return_value=b"some"))
 
         with pytest.raises(errors.GatewayError, match="Unexpected message type received TEXT, expected BINARY"):
             await transport_impl._receive_and_check(10)
@@ -282,6 +307,7 @@ class TestGatewayTransport:
             trust_env=proxy_settings.trust_env,
             version=aiohttp.HttpVersion11,
             ws_response_class=shard._GatewayTransport,
+            json_serialize=data_binding.dump_json,
         )
         mock_client_session.ws_connect.assert_called_once_with(
             max_msg_size=0,
@@ -577,6 +603,30 @@ class TestGatewayShardImpl:
             proxy_settings=proxy_settings,
         )
 
+    def test__init__sets_identify_properties(self, http_settings, proxy_settings):
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(platform, "system", return_value="Potato PC"))
+        stack.enter_context(mock.patch.object(platform, "architecture", return_value=["ARM64"]))
+        stack.enter_context(mock.patch.object(aiohttp, "__version__", new="v0.0.1"))
+        stack.enter_context(mock.patch.object(_about, "__version__", new="v1.0.0"))
+
+        with stack:
+            g = shard.GatewayShardImpl(
+                event_manager=mock.Mock(),
+                event_factory=mock.Mock(),
+                http_settings=http_settings,
+                proxy_settings=proxy_settings,
+                intents=intents.Intents.ALL,
+                url="wss://gaytewhuy.discord.meh",
+                token="12345",
+            )
+
+        assert g._identify_properties == {
+            "$os": "Potato PC ARM64",
+            "$browser": "aiohttp v0.0.1",
+            "$device": "hikari v1.0.0",
+        }
+
     @pytest.mark.parametrize(
         ("compression", "expect"),
         [
@@ -976,14 +1026,13 @@ class TestGatewayShardImpl:
         client._shard_count = 1
         client._serialize_and_store_presence_payload = mock.Mock(return_value={"presence": "payload"})
         client._send_json = mock.AsyncMock()
-        stack = contextlib.ExitStack()
-        stack.enter_context(mock.patch.object(platform, "system", return_value="Potato PC"))
-        stack.enter_context(mock.patch.object(platform, "architecture", return_value=["ARM64"]))
-        stack.enter_context(mock.patch.object(aiohttp, "__version__", new="v0.0.1"))
-        stack.enter_context(mock.patch.object(_about, "__version__", new="v1.0.0"))
+        client._identify_properties = {
+            "$os": "Potato PC ARM64",
+            "$browser": "aiohttp v0.0.1",
+            "$device": "hikari v1.0.0",
+        }
 
-        with stack:
-            await client._identify()
+        await client._identify()
 
         expected_json = {
             "op": 2,
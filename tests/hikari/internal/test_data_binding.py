@@ -19,6 +19,7 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import json
 import typing
 
 import attr
@@ -261,3 +262,27 @@ class TestCastJSONArray:
         assert cast.call_args_list[0] == mock.call("foo", foo=42, bar="OK")
         assert cast.call_args_list[1] == mock.call("bar", foo=42, bar="OK")
         assert cast.call_args_list[2] == mock.call("baz", foo=42, bar="OK")
+
+
+class TestDumpJSON:
+    def test_dump_json_returns_str(self):
+        result = data_binding.dump_json({"foo": [1, "bar", None, True]})
+
+        assert isinstance(result, str)
+        assert json.loads(result) == {"foo": [1, "bar", None, True]}
+
+    def test_dump_json_with_array(self):
+        result = data_binding.dump_json([{"id": "123"}, 4.5])
+
+        assert isinstance(result, str)
+        assert json.loads(result) == [{"id": "123"}, 4.5]
+
+
+class TestLoadJSON:
+    @pytest.mark.parametrize("payload", ['{"foo": [1, "bar", null, true]}', b'{"foo": [1, "bar", null, true]}'])
+    def test_load_json(self, payload):
+        assert data_binding.load_json(payload) == {"foo": [1, "bar", None, True]}
+
+    @pytest.mark.parametrize("payload", ['[{"id": "123"}, 4.5]', b'[{"id": "123"}, 4.5]'])
+    def test_load_json_with_array(self, payload):
+        assert data_binding.load_json(payload) == [{"id": "123"}, 4.5]
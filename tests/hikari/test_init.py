@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+import hikari
+from hikari.impl import rest
+
+
+def test_lazy_attribute_is_resolved_and_cached(monkeypatch):
+    monkeypatch.delitem(vars(hikari), "RESTApp", raising=False)
+
+    assert hikari.RESTApp is rest.RESTApp
+    assert vars(hikari)["RESTApp"] is rest.RESTApp
+
+
+def test_unknown_attribute_raises_AttributeError():
+    with pytest.raises(AttributeError, match="module 'hikari' has no attribute 'DefinitelyNotAThing'"):
+        hikari.DefinitelyNotAThing
+
+
+def test___dir___includes_lazy_attributes():
+    names = dir(hikari)
+
+    assert "BotApp" in names
+    assert "ClientCredentialsStrategy" in names
+    assert "RESTApp" in names
+
+
+def test_star_import_includes_lazy_attributes():
+    namespace = {}
+
+    exec("from hikari import *", namespace)
+
+    assert namespace["BotApp"] is hikari.BotApp
+    assert namespace["ClientCredentialsStrategy"] is hikari.ClientCredentialsStrategy
+    assert namespace["RESTApp"] is hikari.RESTApp